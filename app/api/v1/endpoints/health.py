@@ -3,8 +3,7 @@
 import logging
 import time
 
-from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Response, status
 
 from app.core.assetripper import assetripper_manager
 from app.core.task_queue import task_queue_manager
@@ -14,20 +13,26 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Track startup time for uptime calculation
-_startup_time = time.time()
+# Track startup time for uptime calculation (monotonic: immune to clock changes)
+_startup_time = time.monotonic()
 
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check() -> JSONResponse:
+async def health_check(response: Response) -> HealthResponse:
     """
     Health check endpoint.
 
+    Stays ``async`` on purpose: the body only reads in-process state, while
+    a plain ``def`` handler would be sent to the threadpool on every probe.
+
+    Args:
+        response: Response used to set the status code
+
     Returns:
         HealthResponse: Health status information
     """
     # Check AssetRipper status
-    is_healthy = await assetripper_manager.is_healthy()
+    is_healthy = assetripper_manager.is_healthy
     assetripper_status = "running" if is_healthy else "down"
 
     # Get queue information
@@ -35,21 +40,18 @@ async def health_check() -> JSONResponse:
     current_task = task_queue_manager.get_current_task_id()
 
     # Calculate uptime
-    uptime_seconds = int(time.time() - _startup_time)
+    uptime_seconds = int(time.monotonic() - _startup_time)
 
     # Determine overall status
     overall_status = "healthy" if is_healthy else "unhealthy"
     status_code = status.HTTP_200_OK if is_healthy else status.HTTP_503_SERVICE_UNAVAILABLE
 
-    response_data = HealthResponse(
+    response.status_code = status_code
+
+    return HealthResponse(
         status=overall_status,
         assetripper_status=assetripper_status,
         queue_size=queue_size,
         current_task=current_task,
         uptime_seconds=uptime_seconds,
     )
-
-    return JSONResponse(
-        status_code=status_code,
-        content=response_data.model_dump(),
-    )
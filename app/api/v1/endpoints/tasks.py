@@ -1,29 +1,63 @@
 """Task endpoints for querying and downloading."""
 
+import asyncio
 import logging
 import tempfile
 from pathlib import Path
+from typing import AsyncIterator, BinaryIO
+from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import FileResponse
-from sqlalchemy import select
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import bindparam, delete, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.database import get_db
 from app.models import Task
 from app.schemas import TaskResponse, TaskStatus
-from app.utils.file_utils import create_zip_archive, get_task_assets_dir
+from app.utils.file_utils import (
+    cleanup_task_files,
+    create_zip_archive,
+    get_task_assets_dir,
+    iter_file_chunks,
+    iter_zip_stream,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Cached statement: SQL compilation happens once, not on every request
+_get_task_stmt = lambda_stmt(lambda: select(Task).where(Task.id == bindparam("task_id")))
+
+# Downloads that may be zipped into an in-memory spool at once; each spool
+# holds up to download_spool_max_size bytes until it has been sent
+_spool_slots = asyncio.Semaphore(settings.download_spool_concurrency)
+
+
+def _content_disposition(filename: str) -> str:
+    """Build an attachment Content-Disposition header (RFC 6266)."""
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
+async def _iter_spooled_download(spool: BinaryIO) -> AsyncIterator[bytes]:
+    """Stream a spooled download archive, then free its spool slot."""
+    try:
+        async for chunk in iter_file_chunks(spool):
+            yield chunk
+    finally:
+        _spool_slots.release()
+
 
 @router.get("/tasks/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: str,
     db: AsyncSession = Depends(get_db),
-) -> TaskResponse:
+) -> Task:
     """
     Get task status and information.
 
@@ -32,12 +66,12 @@ async def get_task(
         db: Database session
 
     Returns:
-        TaskResponse: Task information
+        Task: Task row, serialized through the TaskResponse response model
 
     Raises:
         HTTPException: If task not found
     """
-    result = await db.execute(select(Task).where(Task.id == task_id))
+    result = await db.execute(_get_task_stmt, {"task_id": task_id})
     task = result.scalar_one_or_none()
 
     if not task:
@@ -46,14 +80,16 @@ async def get_task(
             detail=f"Task {task_id} not found",
         )
 
-    return TaskResponse.model_validate(task)
+    # response_model validates the row once; building a TaskResponse here
+    # would be dumped and validated again by FastAPI
+    return task
 
 
 @router.get("/download/{task_id}")
 async def download_assets(
     task_id: str,
     db: AsyncSession = Depends(get_db),
-) -> FileResponse:
+) -> StreamingResponse:
     """
     Download exported Assets as a ZIP file.
 
@@ -62,13 +98,13 @@ async def download_assets(
         db: Database session
 
     Returns:
-        FileResponse: ZIP file containing Assets
+        StreamingResponse: ZIP file containing Assets
 
     Raises:
         HTTPException: If task not found, not completed, or files missing
     """
     # Get task from database
-    result = await db.execute(select(Task).where(Task.id == task_id))
+    result = await db.execute(_get_task_stmt, {"task_id": task_id})
     task = result.scalar_one_or_none()
 
     if not task:
@@ -84,54 +120,92 @@ async def download_assets(
             detail=f"Task {task_id} is not completed (status: {task.status})",
         )
 
-    # Check if Assets directory exists
-    assets_dir = get_task_assets_dir(task_id)
+    # Check if Assets directory exists (deduplicated tasks share another task's export)
+    assets_dir = Path(task.export_path) if task.export_path else get_task_assets_dir(task_id)
     if not assets_dir.exists():
         raise HTTPException(
             status_code=status.HTTP_410_GONE,
             detail=f"Export files for task {task_id} have been cleaned up",
         )
 
-    try:
-        # Create ZIP file in temporary location
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".zip") as tmp_file:
-            tmp_zip_path = Path(tmp_file.name)
-
-        # Create ZIP archive of Assets directory
-        logger.info(f"Creating ZIP archive for task {task_id}")
-        create_zip_archive(assets_dir, tmp_zip_path, arcname="Assets")
+    filename = f"{task.original_filename.rsplit('.', 1)[0]}_assets.zip"
+    headers = {"Content-Disposition": _content_disposition(filename)}
+
+    # Small exports are zipped in memory so the response has a Content-Length,
+    # as long as a spool slot is free; otherwise they are streamed like large ones
+    spool_max_size = settings.download_spool_max_size
+    if (
+        task.export_size_bytes is not None
+        and task.export_size_bytes <= spool_max_size
+        and not _spool_slots.locked()
+    ):
+        # A slot is free, so this returns without waiting
+        await _spool_slots.acquire()
+        logger.info(f"Creating in-memory ZIP archive for task {task_id}")
+        # Should the archive outgrow the spool, it rolls over onto the export
+        # volume (unlinked immediately) rather than the container's /tmp
+        spool = tempfile.SpooledTemporaryFile(
+            max_size=spool_max_size, dir=settings.export_dir
+        )
 
-        # Return ZIP file
-        return FileResponse(
-            path=str(tmp_zip_path),
+        zip_size = None
+        try:
+            zip_size = await asyncio.to_thread(
+                create_zip_archive,
+                assets_dir,
+                spool,
+                arcname="Assets",
+                compress_text=settings.download_compress_text_assets,
+            )
+        except Exception as e:
+            logger.exception(f"Failed to create ZIP for task {task_id}: {e}")
+
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to create download archive: {str(e)}",
+            )
+        finally:
+            # Failed or cancelled: the response never takes over the spool
+            if zip_size is None:
+                spool.close()
+                _spool_slots.release()
+
+        headers["Content-Length"] = str(zip_size)
+        return StreamingResponse(
+            _iter_spooled_download(spool),
             media_type="application/zip",
-            filename=f"{task.original_filename.rsplit('.', 1)[0]}_assets.zip",
-            background=None,  # File will be deleted after response is sent
+            headers=headers,
         )
 
-    except Exception as e:
-        logger.exception(f"Failed to create ZIP for task {task_id}: {e}")
-
-        # Clean up temporary file if it exists
-        if tmp_zip_path.exists():
-            tmp_zip_path.unlink()
+    # Larger exports are streamed straight into the response
+    logger.info(f"Streaming ZIP archive for task {task_id}")
 
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create download archive: {str(e)}",
-        )
+    return StreamingResponse(
+        iter_zip_stream(
+            assets_dir,
+            arcname="Assets",
+            compress_text=settings.download_compress_text_assets,
+        ),
+        media_type="application/zip",
+        headers=headers,
+    )
 
 
 @router.delete("/tasks/{task_id}")
 async def delete_task(
     task_id: str,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ) -> dict:
     """
     Delete a task and its associated files.
 
+    The files are removed after the response is sent, so deleting a large
+    export does not hold up the request.
+
     Args:
         task_id: Task ID
+        background_tasks: Tasks run after the response is sent
         db: Database session
 
     Returns:
@@ -140,31 +214,38 @@ async def delete_task(
     Raises:
         HTTPException: If task not found
     """
-    from app.utils.file_utils import cleanup_task_files
-
-    # Get task from database
-    result = await db.execute(select(Task).where(Task.id == task_id))
-    task = result.scalar_one_or_none()
+    # Delete task from database in a single round-trip
+    result = await db.execute(
+        delete(Task).where(Task.id == task_id).returning(Task.id)
+    )
 
-    if not task:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task {task_id} not found",
         )
 
-    # Clean up files
-    try:
-        cleanup_task_files(task_id)
-    except Exception as e:
-        logger.warning(f"Failed to clean up files for task {task_id}: {e}")
-
-    # Delete task from database
-    await db.delete(task)
     await db.commit()
 
+    # Sync background tasks run in the threadpool, off the event loop
+    background_tasks.add_task(_cleanup_deleted_task_files, task_id)
+
     logger.info(f"Task {task_id} deleted")
 
     return {
         "message": f"Task {task_id} deleted successfully",
         "task_id": task_id,
     }
+
+
+def _cleanup_deleted_task_files(task_id: str) -> None:
+    """
+    Remove the files of a deleted task, logging instead of raising.
+
+    Args:
+        task_id: Task ID
+    """
+    try:
+        cleanup_task_files(task_id)
+    except Exception as e:
+        logger.warning(f"Failed to clean up files for task {task_id}: {e}")
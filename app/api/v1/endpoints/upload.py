@@ -1,20 +1,27 @@
 """Upload endpoint for file uploads."""
 
+import asyncio
 import logging
 import uuid
-from datetime import datetime
+from pathlib import Path
+from typing import Optional
 
 from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.task_queue import task_queue_manager
+from app.core.upload_gate import CAPACITY_ERROR, CAPACITY_RETRY_AFTER
 from app.database import get_db
 from app.models import Task
 from app.schemas import TaskStatus, TaskUploadResponse
 from app.utils.file_utils import (
-    calculate_file_hash,
+    cleanup_task_files,
     ensure_task_directories,
+    get_task_assets_dir,
     get_task_upload_path,
+    link_directory_tree,
+    link_duplicate_file,
     save_upload_file,
 )
 
@@ -41,7 +48,7 @@ async def upload_file(
         TaskUploadResponse: Task information
 
     Raises:
-        HTTPException: If upload fails
+        HTTPException: If upload fails, or 503 if the task queue is full
     """
     logger.info(f"Received upload request for file: {file.filename}")
 
@@ -59,21 +66,32 @@ async def upload_file(
         # Ensure task directories exist
         upload_dir, export_dir = ensure_task_directories(task_id)
 
-        # Save uploaded file
+        # Save uploaded file, hashing it on the way (for potential deduplication)
         upload_path = get_task_upload_path(task_id, file.filename)
-        file_size = await save_upload_file(file, upload_path)
-
-        # Calculate file hash (for potential deduplication)
-        file_hash = await calculate_file_hash(upload_path)
+        file_size, file_hash = await save_upload_file(file, upload_path)
 
         # Get client IP
         client_ip = request.client.host if request.client else None
 
-        # Create task in database
+        # Reuse the export of an identical upload that was already processed
+        existing = await db.scalar(
+            select(Task)
+            .where(Task.file_hash == file_hash, Task.status == TaskStatus.COMPLETED)
+            .order_by(Task.completed_at.desc())
+            .limit(1)
+        )
+        if existing and existing.export_path and Path(existing.export_path).exists():
+            try:
+                return await _create_duplicate_task(
+                    db, task_id, file.filename, upload_path, file_size, file_hash, client_ip, existing
+                )
+            except OSError as e:
+                logger.warning(f"Could not reuse export for task {task_id}, processing it instead: {e}")
+
+        # Create task in database (created_at is stamped by the column default)
         task = Task(
             id=task_id,
             status=TaskStatus.PENDING,
-            created_at=datetime.utcnow(),
             original_filename=file.filename,
             upload_path=str(upload_path),
             file_size_bytes=file_size,
@@ -86,8 +104,21 @@ async def upload_file(
 
         logger.info(f"Task {task_id} created for file {file.filename} ({file_size} bytes)")
 
-        # Add task to processing queue
-        await task_queue_manager.add_task(task_id)
+        # Add task to processing queue. The upload gate keeps it from filling
+        # up; should it be full anyway, refuse the upload the way the gate does
+        try:
+            await task_queue_manager.add_task(task_id)
+        except asyncio.QueueFull:
+            logger.warning(f"Rejecting upload: task queue full, discarding task {task_id}")
+            await db.delete(task)
+            await db.commit()
+            await asyncio.to_thread(cleanup_task_files, task_id)
+
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=CAPACITY_ERROR,
+                headers={"Retry-After": CAPACITY_RETRY_AFTER},
+            )
 
         return TaskUploadResponse(
             task_id=task_id,
@@ -96,9 +127,78 @@ async def upload_file(
             created_at=task.created_at,
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception(f"Failed to upload file: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to upload file: {str(e)}",
         )
+
+
+async def _create_duplicate_task(
+    db: AsyncSession,
+    task_id: str,
+    filename: str,
+    upload_path: Path,
+    file_size: int,
+    file_hash: str,
+    client_ip: Optional[str],
+    existing: Task,
+) -> TaskUploadResponse:
+    """
+    Create an already completed task from the export of an identical upload.
+
+    The task gets its own hard-linked copy of the export tree, so deleting
+    or cleaning up either task never affects the other.
+
+    Args:
+        db: Database session
+        task_id: New task ID
+        filename: Original filename of the new upload
+        upload_path: Where the new upload was saved
+        file_size: Upload size in bytes
+        file_hash: SHA256 of the upload
+        client_ip: Client IP address
+        existing: Completed task with the same file hash
+
+    Returns:
+        TaskUploadResponse: Task information
+
+    Raises:
+        OSError: If the export tree could not be linked
+    """
+    assets_dir = get_task_assets_dir(task_id)
+    await asyncio.to_thread(link_directory_tree, Path(existing.export_path), assets_dir)
+
+    # Keep a single copy of the bytes on disk
+    link_duplicate_file(Path(existing.upload_path), upload_path)
+
+    task = Task(
+        id=task_id,
+        status=TaskStatus.COMPLETED,
+        original_filename=filename,
+        upload_path=str(upload_path),
+        file_size_bytes=file_size,
+        file_hash=file_hash,
+        export_path=str(assets_dir),
+        export_size_bytes=existing.export_size_bytes,
+        user_ip=client_ip,
+    )
+
+    # created_at is stamped by the column default; the task starts and
+    # completes at that same instant
+    db.add(task)
+    await db.flush()
+    task.started_at = task.completed_at = task.created_at
+    await db.commit()
+
+    logger.info(f"Task {task_id} created for file {filename}, reusing export of task {existing.id}")
+
+    return TaskUploadResponse(
+        task_id=task_id,
+        status=TaskStatus.COMPLETED,
+        message="Identical file already processed. Export is ready for download.",
+        created_at=task.created_at,
+    )
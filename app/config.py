@@ -45,6 +45,12 @@ class Settings(BaseSettings):
         default="sqlite+aiosqlite:///app/data/db/assetripper.db",
         description="Database URL",
     )
+    database_pool_size: int = Field(
+        default=10, description="Database connections kept open in the pool"
+    )
+    database_max_overflow: int = Field(
+        default=20, description="Extra database connections allowed under load"
+    )
 
     # File storage settings
     upload_dir: Path = Field(
@@ -55,6 +61,10 @@ class Settings(BaseSettings):
     )
 
     # File cleanup settings
+    file_cleanup_enabled: bool = Field(
+        default=False,
+        description="Run the scheduled job that deletes task files past the retention period",
+    )
     file_retention_days: int = Field(
         default=30, description="File retention period in days"
     )
@@ -62,10 +72,28 @@ class Settings(BaseSettings):
         default="0 2 * * *", description="Cleanup schedule (cron format)"
     )
 
+    # Download settings
+    download_compress_text_assets: bool = Field(
+        default=False,
+        description="DEFLATE text-based assets (YAML, scripts, metadata) in download archives",
+    )
+    download_spool_max_size: int = Field(
+        default=64 * 1024 * 1024,
+        description="Exports up to this size (bytes) are zipped in memory before download",
+    )
+    download_spool_concurrency: int = Field(
+        default=4,
+        description="Downloads zipped in memory at once; further ones are streamed",
+    )
+
     # Task processing settings
     max_concurrent_tasks: int = Field(
         default=1, description="Maximum concurrent tasks"
     )
+    task_queue_depth: int = Field(
+        default=20,
+        description="Maximum tasks waiting for processing; further uploads get 503",
+    )
     task_timeout_seconds: int = Field(
         default=3600, description="Task timeout in seconds"
     )
@@ -4,6 +4,7 @@ import asyncio
 import logging
 from pathlib import Path
 from typing import Optional
+from urllib.parse import urlencode
 
 import httpx
 
@@ -11,6 +12,14 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Headers for form bodies we encode ourselves (see _path_form)
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+
+def _path_form(path: str) -> bytes:
+    """Encode the single-field ``path`` form AssetRipper endpoints expect."""
+    return urlencode({"path": path}).encode()
+
 
 class AssetRipperError(Exception):
     """Base exception for AssetRipper errors."""
@@ -55,6 +64,15 @@ class AssetRipperManager:
         Raises:
             AssetRipperProcessError: If process fails to start
         """
+        # Initialize HTTP client first so readiness polling starts as soon as
+        # the process is spawned (keep a few sockets alive between calls and
+        # health checks instead of reconnecting to AssetRipper every time)
+        self.client = httpx.AsyncClient(
+            base_url=settings.assetripper_base_url,
+            timeout=httpx.Timeout(600.0, connect=10.0),
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=120.0),
+        )
+
         if self._use_external_host:
             logger.info(f"Using external AssetRipper at {settings.assetripper_host}")
         else:
@@ -81,14 +99,10 @@ class AssetRipperManager:
                 )
                 logger.info(f"AssetRipper process started with PID {self.process.pid}")
             except Exception as e:
+                await self.client.aclose()
+                self.client = None
                 raise AssetRipperProcessError(f"Failed to start AssetRipper: {e}")
 
-        # Initialize HTTP client
-        self.client = httpx.AsyncClient(
-            base_url=settings.assetripper_base_url,
-            timeout=httpx.Timeout(600.0, connect=10.0),
-        )
-
         # Wait for AssetRipper to be ready
         await self._wait_for_ready()
 
@@ -129,10 +143,13 @@ class AssetRipperManager:
         self.process = None
         self._is_healthy = False
 
-    async def is_healthy(self) -> bool:
+    @property
+    def is_healthy(self) -> bool:
         """
         Check if AssetRipper is healthy.
 
+        Returns the state recorded by the last health check; never does I/O.
+
         Returns:
             bool: True if healthy, False otherwise
         """
@@ -157,7 +174,8 @@ class AssetRipperManager:
         try:
             response = await self.client.post(
                 "/LoadFile",
-                data={"path": file_path},
+                content=_path_form(file_path),
+                headers=_FORM_HEADERS,
                 timeout=settings.task_load_timeout,
                 follow_redirects=True,
             )
@@ -194,7 +212,8 @@ class AssetRipperManager:
         try:
             response = await self.client.post(
                 "/Export/PrimaryContent",
-                data={"path": export_path},
+                content=_path_form(export_path),
+                headers=_FORM_HEADERS,
                 timeout=settings.task_export_timeout,
                 follow_redirects=True,
             )
@@ -232,6 +251,7 @@ class AssetRipperManager:
 
         start_time = asyncio.get_event_loop().time()
         timeout = settings.assetripper_startup_timeout
+        delay = 0.025
 
         while True:
             # Check if process is still running (only if we started it)
@@ -255,8 +275,33 @@ class AssetRipperManager:
             except (httpx.RequestError, httpx.TimeoutException):
                 pass
 
-            # Wait before retry
-            await asyncio.sleep(1)
+            # Wait before retry (exponential backoff, so a fast start is noticed quickly)
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.7, 0.5)
+
+    async def _probe(self) -> bool:
+        """
+        Probe AssetRipper over HTTP and record the result.
+
+        Returns:
+            bool: True if AssetRipper answered with 200, False otherwise
+
+        Raises:
+            httpx.RequestError: If AssetRipper cannot be reached (recorded as unhealthy)
+        """
+        try:
+            response = await self.client.get("/", timeout=5.0)
+        except httpx.RequestError:
+            self._is_healthy = False
+            raise
+
+        if response.status_code == 200:
+            self._is_healthy = True
+        else:
+            logger.warning(f"AssetRipper health check failed: status {response.status_code}")
+            self._is_healthy = False
+
+        return self._is_healthy
 
     async def _health_check_loop(self) -> None:
         """Background task to periodically check AssetRipper health."""
@@ -276,12 +321,7 @@ class AssetRipperManager:
 
                 # HTTP health check
                 try:
-                    response = await self.client.get("/", timeout=5.0)
-                    if response.status_code == 200:
-                        self._is_healthy = True
-                    else:
-                        logger.warning(f"AssetRipper health check failed: status {response.status_code}")
-                        self._is_healthy = False
+                    await self._probe()
                 except (httpx.RequestError, httpx.TimeoutException) as e:
                     logger.warning(f"AssetRipper health check failed: {e}")
                     self._is_healthy = False
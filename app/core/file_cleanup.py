@@ -1,10 +1,14 @@
 """File cleanup scheduler."""
 
+import asyncio
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from sqlalchemy import select
+from sqlalchemy import and_, bindparam, exists, insert, lambda_stmt, or_, select
 
 from app.config import settings
 from app.database import AsyncSessionLocal
@@ -13,6 +17,33 @@ from app.utils.file_utils import cleanup_task_files
 
 logger = logging.getLogger(__name__)
 
+# Number of task directories deleted concurrently during cleanup
+CLEANUP_WORKERS = min(8, os.cpu_count() or 1)
+
+# Number of expired tasks fetched and processed per batch
+CLEANUP_BATCH_SIZE = 200
+
+# Cached statement for one page of tasks past the retention period whose
+# files have not been cleaned up yet (task rows are kept after cleanup).
+# Pages are keyed on (created_at, id), so tasks that failed to clean up are
+# skipped for the rest of the run instead of being fetched again
+_old_tasks_stmt = lambda_stmt(
+    lambda: select(Task.id, Task.created_at, Task.upload_path, Task.export_path)
+    .where(
+        Task.created_at < bindparam("cutoff"),
+        or_(
+            Task.created_at > bindparam("after_created_at"),
+            and_(
+                Task.created_at == bindparam("after_created_at"),
+                Task.id > bindparam("after_id"),
+            ),
+        ),
+        ~exists().where(CleanupLog.task_id == Task.id),
+    )
+    .order_by(Task.created_at, Task.id)
+    .limit(bindparam("batch_size"))
+)
+
 
 class FileCleanupScheduler:
     """
@@ -24,6 +55,7 @@ class FileCleanupScheduler:
     def __init__(self):
         """Initialize file cleanup scheduler."""
         self.scheduler = AsyncIOScheduler()
+        self._executor: Optional[ThreadPoolExecutor] = None
         self._running = False
 
     def start(self) -> None:
@@ -54,6 +86,9 @@ class FileCleanupScheduler:
             replace_existing=True,
         )
 
+        self._executor = ThreadPoolExecutor(
+            max_workers=CLEANUP_WORKERS, thread_name_prefix="file-cleanup"
+        )
         self.scheduler.start()
         self._running = True
 
@@ -68,6 +103,9 @@ class FileCleanupScheduler:
             return
 
         self.scheduler.shutdown(wait=False)
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         self._running = False
         logger.info("File cleanup scheduler stopped")
 
@@ -83,52 +121,75 @@ class FileCleanupScheduler:
         cutoff_date = datetime.utcnow() - timedelta(days=settings.file_retention_days)
         logger.info(f"Cleaning up tasks created before {cutoff_date}")
 
+        loop = asyncio.get_running_loop()
+        found_count = 0
+        cleaned_count = 0
+        failed_count = 0
+        # Keyset position: (created_at, id) of the last task of the previous page
+        after_created_at, after_id = datetime.min, ""
+
         async with AsyncSessionLocal() as db:
-            # Find old tasks
-            result = await db.execute(
-                select(Task).where(Task.created_at < cutoff_date)
-            )
-            old_tasks = result.scalars().all()
-
-            if not old_tasks:
-                logger.info("No old tasks to clean up")
-                return
-
-            logger.info(f"Found {len(old_tasks)} tasks to clean up")
-
-            cleaned_count = 0
-            failed_count = 0
-
-            for task in old_tasks:
-                try:
-                    # Clean up task files
-                    cleanup_task_files(task.id)
-
-                    # Log cleanup
-                    cleanup_log = CleanupLog(
-                        task_id=task.id,
-                        upload_path=task.upload_path,
-                        export_path=task.export_path,
-                        reason="retention_expired",
+            while True:
+                result = await db.execute(
+                    _old_tasks_stmt,
+                    {
+                        "cutoff": cutoff_date,
+                        "after_created_at": after_created_at,
+                        "after_id": after_id,
+                        "batch_size": CLEANUP_BATCH_SIZE,
+                    },
+                )
+                old_tasks = result.all()
+                if not old_tasks:
+                    break
+
+                found_count += len(old_tasks)
+                after_created_at, after_id = old_tasks[-1].created_at, old_tasks[-1].id
+                logger.info(f"Cleaning up batch of {len(old_tasks)} tasks")
+
+                # Delete task files concurrently on the cleanup executor, off the event loop
+                results = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(self._executor, cleanup_task_files, task.id)
+                        for task in old_tasks
+                    ),
+                    return_exceptions=True,
+                )
+
+                cleanup_logs = []
+
+                for task, outcome in zip(old_tasks, results):
+                    if isinstance(outcome, Exception):
+                        logger.error(f"Failed to clean up task {task.id}: {outcome}")
+                        failed_count += 1
+                        continue
+
+                    cleanup_logs.append(
+                        {
+                            "task_id": task.id,
+                            "upload_path": task.upload_path,
+                            "export_path": task.export_path,
+                            "reason": "retention_expired",
+                        }
                     )
-                    db.add(cleanup_log)
-
-                    # Optionally delete task record
-                    # await db.delete(task)
 
-                    cleaned_count += 1
+                # Log the batch's cleanups in a single insert and commit it
+                # before the next batch's files are deleted, so the SQLite
+                # write lock is never held across filesystem work
+                if cleanup_logs:
+                    await db.execute(insert(CleanupLog), cleanup_logs)
+                    await db.commit()
 
-                except Exception as e:
-                    logger.error(f"Failed to clean up task {task.id}: {e}")
-                    failed_count += 1
+                cleaned_count += len(cleanup_logs)
 
-            # Commit cleanup logs
-            await db.commit()
+        if not found_count:
+            logger.info("No old tasks to clean up")
+            return
 
-            logger.info(
-                f"File cleanup completed: {cleaned_count} tasks cleaned, "
-                f"{failed_count} failed"
-            )
+        logger.info(
+            f"File cleanup completed: {cleaned_count} tasks cleaned, "
+            f"{failed_count} failed"
+        )
 
 
 # Global file cleanup scheduler instance
@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -35,7 +35,10 @@ class TaskQueueManager:
 
     def __init__(self):
         """Initialize task queue manager."""
-        self.queue: asyncio.Queue[str] = asyncio.Queue()
+        # Backstop for the upload gate, which admits at most this many jobs
+        self.queue: asyncio.Queue[str] = asyncio.Queue(
+            maxsize=settings.max_concurrent_tasks + settings.task_queue_depth
+        )
         self.worker_task: Optional[asyncio.Task] = None
         self.current_task_id: Optional[str] = None
         self._running = False
@@ -71,13 +74,16 @@ class TaskQueueManager:
 
     async def add_task(self, task_id: str) -> None:
         """
-        Add a task to the queue.
+        Add a task to the queue without waiting for space.
 
         Args:
             task_id: Task ID to process
+
+        Raises:
+            asyncio.QueueFull: If the queue is already at capacity
         """
-        await self.queue.put(task_id)
-        logger.info(f"Task {task_id} added to queue (queue size: {self.queue.qsize()})")
+        self.queue.put_nowait(task_id)
+        logger.info("Task %s added to queue (queue size: %d)", task_id, self.queue.qsize())
 
     def get_queue_size(self) -> int:
         """
@@ -103,20 +109,17 @@ class TaskQueueManager:
 
         while self._running:
             try:
-                # Get next task from queue (with timeout to allow checking _running)
-                try:
-                    task_id = await asyncio.wait_for(self.queue.get(), timeout=1.0)
-                except asyncio.TimeoutError:
-                    continue
+                # Block until a task arrives; stop() cancels the wait
+                task_id = await self.queue.get()
 
                 self.current_task_id = task_id
-                logger.info(f"Processing task {task_id}")
+                logger.info("Processing task %s", task_id)
 
                 # Process the task
                 try:
                     await self._process_task(task_id)
                 except Exception as e:
-                    logger.exception(f"Error processing task {task_id}: {e}")
+                    logger.exception("Error processing task %s: %s", task_id, e)
                     await self._mark_task_failed(task_id, str(e))
                 finally:
                     self.current_task_id = None
@@ -126,7 +129,7 @@ class TaskQueueManager:
                 logger.info("Task queue worker cancelled")
                 break
             except Exception as e:
-                logger.exception(f"Unexpected error in worker loop: {e}")
+                logger.exception("Unexpected error in worker loop: %s", e)
                 await asyncio.sleep(1)  # Avoid tight loop on persistent errors
 
         logger.info("Task queue worker loop ended")
@@ -135,64 +138,66 @@ class TaskQueueManager:
         """
         Process a single task.
 
+        Every state change of the task goes through one session. A commit
+        hands the connection back to the pool, so the session holds none
+        while AssetRipper runs.
+
         Args:
             task_id: Task ID to process
         """
         async with AsyncSessionLocal() as db:
-            # Get task from database
-            result = await db.execute(select(Task).where(Task.id == task_id))
-            task = result.scalar_one_or_none()
-
-            if not task:
-                logger.error(f"Task {task_id} not found in database")
-                return
+            # Claim the task (PENDING -> PROCESSING) in a single statement
+            result = await db.execute(
+                update(Task)
+                .where(Task.id == task_id, Task.status == TaskStatus.PENDING)
+                .values(status=TaskStatus.PROCESSING, started_at=datetime.utcnow())
+                .returning(Task.upload_path)
+            )
+            claimed_upload_path = result.scalar_one_or_none()
 
-            if task.status != TaskStatus.PENDING:
-                logger.warning(f"Task {task_id} is not PENDING (status: {task.status}), skipping")
+            if claimed_upload_path is None:
+                logger.warning("Task %s not found or not PENDING, skipping", task_id)
                 return
 
-            # Update status to PROCESSING
-            task.status = TaskStatus.PROCESSING
-            task.started_at = datetime.utcnow()
+            # Committed on its own so clients see PROCESSING while the export runs
             await db.commit()
 
-            logger.info(f"Task {task_id} started processing")
+            logger.info("Task %s started processing", task_id)
 
-        try:
-            # Step 1: Load file into AssetRipper
-            upload_path = Path(task.upload_path)
-            if not upload_path.exists():
-                raise FileNotFoundError(f"Upload file not found: {upload_path}")
+            try:
+                # Step 1: Load file into AssetRipper
+                upload_path = Path(claimed_upload_path)
+                if not upload_path.exists():
+                    raise FileNotFoundError(f"Upload file not found: {upload_path}")
 
-            logger.info(f"Task {task_id}: Loading file into AssetRipper: {upload_path}")
-            await assetripper_manager.load_file(str(upload_path.absolute()))
+                logger.info("Task %s: Loading file into AssetRipper: %s", task_id, upload_path)
+                await assetripper_manager.load_file(str(upload_path.absolute()))
 
-            # Step 2: Export primary content
-            export_dir = get_task_export_dir(task_id)
-            logger.info(f"Task {task_id}: Exporting to: {export_dir}")
-            await assetripper_manager.export_primary_content(str(export_dir.absolute()))
+                # Step 2: Export primary content
+                export_dir = get_task_export_dir(task_id)
+                logger.info("Task %s: Exporting to: %s", task_id, export_dir)
+                await assetripper_manager.export_primary_content(str(export_dir.absolute()))
 
-            # Step 3: Verify Assets directory exists
-            assets_dir = get_task_assets_dir(task_id)
-            if not assets_dir.exists():
-                raise FileNotFoundError(f"Assets directory not found after export: {assets_dir}")
+                # Step 3: Verify Assets directory exists
+                assets_dir = get_task_assets_dir(task_id)
+                if not assets_dir.exists():
+                    raise FileNotFoundError(f"Assets directory not found after export: {assets_dir}")
 
-            # Step 4: Calculate export size
-            export_size = get_directory_size(assets_dir)
-            logger.info(f"Task {task_id}: Export size: {export_size} bytes")
+                # Step 4: Calculate export size
+                export_size = await asyncio.to_thread(get_directory_size, assets_dir)
+                logger.info("Task %s: Export size: %d bytes", task_id, export_size)
 
-            # Step 5: Create ZIP archive of Assets directory
-            # Note: We don't create ZIP here, we'll do it on-demand when downloading
-            # to save disk space
+                # Step 5: Create ZIP archive of Assets directory
+                # Note: We don't create ZIP here, we'll do it on-demand when downloading
+                # to save disk space
 
-            # Step 6: Reset AssetRipper for next task
-            try:
-                await assetripper_manager.reset()
-            except Exception as e:
-                logger.warning(f"Failed to reset AssetRipper after task {task_id}: {e}")
+                # Step 6: Reset AssetRipper for next task
+                try:
+                    await assetripper_manager.reset()
+                except Exception as e:
+                    logger.warning("Failed to reset AssetRipper after task %s: %s", task_id, e)
 
-            # Update task as completed
-            async with AsyncSessionLocal() as db:
+                # Update task as completed
                 await db.execute(
                     update(Task)
                     .where(Task.id == task_id)
@@ -206,43 +211,52 @@ class TaskQueueManager:
                 )
                 await db.commit()
 
-            logger.info(f"Task {task_id} completed successfully")
+                logger.info("Task %s completed successfully", task_id)
 
-        except AssetRipperError as e:
-            logger.error(f"Task {task_id} failed due to AssetRipper error: {e}")
-            await self._mark_task_failed(task_id, f"AssetRipper error: {e}")
+            except AssetRipperError as e:
+                logger.error("Task %s failed due to AssetRipper error: %s", task_id, e)
+                await db.rollback()
+                await self._mark_task_failed(task_id, f"AssetRipper error: {e}", db)
 
-            # Try to reset AssetRipper
-            try:
-                await assetripper_manager.reset()
-            except Exception as reset_error:
-                logger.error(f"Failed to reset AssetRipper: {reset_error}")
+                # Try to reset AssetRipper
+                try:
+                    await assetripper_manager.reset()
+                except Exception as reset_error:
+                    logger.error("Failed to reset AssetRipper: %s", reset_error)
 
-        except Exception as e:
-            logger.exception(f"Task {task_id} failed with unexpected error: {e}")
-            await self._mark_task_failed(task_id, f"Unexpected error: {e}")
+            except Exception as e:
+                logger.exception("Task %s failed with unexpected error: %s", task_id, e)
+                await db.rollback()
+                await self._mark_task_failed(task_id, f"Unexpected error: {e}", db)
 
-    async def _mark_task_failed(self, task_id: str, error_message: str) -> None:
+    async def _mark_task_failed(
+        self, task_id: str, error_message: str, db: Optional[AsyncSession] = None
+    ) -> None:
         """
         Mark a task as failed.
 
         Args:
             task_id: Task ID
             error_message: Error message
+            db: Session of the task being processed (a new one is opened if omitted)
         """
-        async with AsyncSessionLocal() as db:
-            await db.execute(
-                update(Task)
-                .where(Task.id == task_id)
-                .values(
-                    status=TaskStatus.FAILED,
-                    completed_at=datetime.utcnow(),
-                    error_message=error_message,
-                )
+        if db is None:
+            async with AsyncSessionLocal() as db:
+                await self._mark_task_failed(task_id, error_message, db)
+            return
+
+        await db.execute(
+            update(Task)
+            .where(Task.id == task_id)
+            .values(
+                status=TaskStatus.FAILED,
+                completed_at=datetime.utcnow(),
+                error_message=error_message,
             )
-            await db.commit()
+        )
+        await db.commit()
 
-        logger.info(f"Task {task_id} marked as FAILED")
+        logger.info("Task %s marked as FAILED", task_id)
 
     async def _recover_interrupted_tasks(self) -> None:
         """
@@ -252,20 +266,18 @@ class TaskQueueManager:
         """
         async with AsyncSessionLocal() as db:
             result = await db.execute(
-                select(Task).where(Task.status == TaskStatus.PROCESSING)
+                update(Task)
+                .where(Task.status == TaskStatus.PROCESSING)
+                .values(
+                    status=TaskStatus.FAILED,
+                    completed_at=datetime.utcnow(),
+                    error_message="Interrupted by container restart"
+                )
             )
-            interrupted_tasks = result.scalars().all()
-
-            if interrupted_tasks:
-                logger.info(f"Found {len(interrupted_tasks)} interrupted tasks, marking as FAILED")
-
-                for task in interrupted_tasks:
-                    task.status = TaskStatus.FAILED
-                    task.completed_at = datetime.utcnow()
-                    task.error_message = "Interrupted by container restart"
+            await db.commit()
 
-                await db.commit()
-                logger.info(f"Marked {len(interrupted_tasks)} interrupted tasks as FAILED")
+        if result.rowcount:
+            logger.info("Marked %d interrupted tasks as FAILED", result.rowcount)
 
 
 # Global task queue manager instance
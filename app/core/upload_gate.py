@@ -0,0 +1,109 @@
+"""Admission control for uploads."""
+
+import logging
+
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import settings
+from app.core.task_queue import task_queue_manager
+
+logger = logging.getLogger(__name__)
+
+# Error message and Retry-After header of the 503 for uploads refused at capacity
+CAPACITY_ERROR = "Service temporarily unavailable, too many pending tasks"
+CAPACITY_RETRY_AFTER = "30"
+
+
+class UploadGate:
+    """
+    Bound on the number of jobs the server accepts at once.
+
+    Counts uploads still in flight plus tasks queued or processing, so a
+    burst of large uploads cannot pile up spooled files on disk and memory.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize upload gate.
+
+        Args:
+            capacity: Maximum number of in-flight uploads and pending tasks
+        """
+        self.capacity = capacity
+        self._inflight = 0
+
+    def try_acquire(self) -> bool:
+        """
+        Reserve a slot for an upload.
+
+        Returns:
+            bool: True if the upload may proceed, False if at capacity
+        """
+        pending = task_queue_manager.get_queue_size()
+        if task_queue_manager.get_current_task_id() is not None:
+            pending += 1
+
+        if self._inflight + pending >= self.capacity:
+            return False
+
+        self._inflight += 1
+        return True
+
+    def release(self) -> None:
+        """Release a slot reserved by try_acquire."""
+        self._inflight -= 1
+
+
+class UploadGateMiddleware:
+    """
+    ASGI middleware rejecting uploads with 503 when the gate is full.
+
+    Runs before the request body is read, unlike route handlers and
+    dependencies, which only run once FastAPI has spooled the whole upload.
+    """
+
+    def __init__(self, app: ASGIApp, path: str, gate: "UploadGate"):
+        """
+        Initialize upload gate middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            path: Upload endpoint path
+            gate: Gate shared by all upload requests
+        """
+        self.app = app
+        self.path = path
+        self.gate = gate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI request."""
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or scope["path"] != self.path
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if not self.gate.try_acquire():
+            logger.warning(f"Rejecting upload: server at capacity ({self.gate.capacity} jobs)")
+            response = ORJSONResponse(
+                status_code=503,
+                content={
+                    "error": CAPACITY_ERROR,
+                    "status_code": 503,
+                },
+                headers={"Retry-After": CAPACITY_RETRY_AFTER},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.gate.release()
+
+
+# Global upload gate instance
+upload_gate = UploadGate(settings.max_concurrent_tasks + settings.task_queue_depth)
@@ -2,23 +2,47 @@
 
 from typing import AsyncGenerator
 
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
 
 # Create async engine
+# aiosqlite defaults to NullPool for file databases (a new connection per
+# session); a queue pool keeps connections, and their page cache, warm
 engine = create_async_engine(
     settings.database_url,
     echo=not settings.is_production,
     future=True,
-    pool_pre_ping=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+    pool_pre_ping=False,
+    query_cache_size=1200,
 )
 
+
+if engine.url.get_backend_name() == "sqlite":
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """Tune each new SQLite connection once; pooling amortizes the cost."""
+        cursor = dbapi_connection.cursor()
+        # WAL lets readers proceed while the worker or cleanup job writes
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256MB
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")  # 64MB page cache
+        cursor.close()
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -50,6 +74,10 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+# Indexes no longer declared on the models, dropped from existing databases
+_LEGACY_INDEXES = ("ix_tasks_status", "ix_tasks_file_hash", "idx_processing_only")
+
+
 async def init_db() -> None:
     """Initialize database tables."""
     # Ensure database directory exists
@@ -60,6 +88,18 @@ async def init_db() -> None:
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # create_all skips tables that already exist, including their indexes
+        await conn.run_sync(_create_missing_indexes)
+        # Drop indexes older databases still maintain on every write
+        for index_name in _LEGACY_INDEXES:
+            await conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+
+
+def _create_missing_indexes(connection) -> None:
+    """Create model indexes added after a table was first created."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
 
 
 async def close_db() -> None:
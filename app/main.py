@@ -4,12 +4,14 @@ import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1.endpoints import health, tasks, upload
 from app.config import settings
 from app.core.assetripper import assetripper_manager
+from app.core.file_cleanup import file_cleanup_scheduler
 from app.core.task_queue import task_queue_manager
+from app.core.upload_gate import UploadGateMiddleware, upload_gate
 from app.database import close_db, init_db
 
 # Configure logging
@@ -56,6 +58,10 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to start task queue: {e}")
         raise
 
+    # Start file cleanup scheduler (opt-in: it deletes upload and export files)
+    if settings.file_cleanup_enabled:
+        file_cleanup_scheduler.start()
+
     logger.info(f"AssetRipper API Server started on {settings.api_host}:{settings.api_port}")
 
     yield
@@ -63,6 +69,12 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down AssetRipper API Server...")
 
+    # Stop file cleanup scheduler
+    try:
+        file_cleanup_scheduler.stop()
+    except Exception as e:
+        logger.error(f"Error stopping file cleanup scheduler: {e}")
+
     # Stop task queue manager
     try:
         await task_queue_manager.stop()
@@ -93,27 +105,33 @@ app = FastAPI(
     description="API service for extracting Unity assets from APK/XAPK/IPA files using AssetRipper",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
+# Shed upload bursts before their bodies are read
+app.add_middleware(UploadGateMiddleware, path="/api/v1/upload", gate=upload_gate)
+
+
 # Exception handlers
 @app.exception_handler(HTTPException)
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
     """Handle HTTP exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.detail,
             "status_code": exc.status_code,
         },
+        headers=exc.headers,
     )
 
 
 @app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle general exceptions."""
     logger.exception(f"Unhandled exception: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
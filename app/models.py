@@ -18,7 +18,7 @@ class Task(Base):
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
 
     # Status tracking
-    status: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, default=datetime.utcnow
     )
@@ -29,9 +29,7 @@ class Task(Base):
     original_filename: Mapped[str] = mapped_column(String(512), nullable=False)
     upload_path: Mapped[str] = mapped_column(String(1024), nullable=False)
     file_size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
-    file_hash: Mapped[Optional[str]] = mapped_column(
-        String(64), nullable=True, index=True
-    )
+    file_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
 
     # Export information
     export_path: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
@@ -75,6 +73,9 @@ class CleanupLog(Base):
         String(50), nullable=False
     )  # 'retention_expired', 'manual', 'failed'
 
+    # Indexes
+    __table_args__ = (Index("idx_cleanup_task_id", "task_id"),)
+
     def __repr__(self) -> str:
         """String representation of CleanupLog."""
         return f"<CleanupLog(id={self.id}, task_id={self.task_id}, reason={self.reason})>"
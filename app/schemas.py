@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TaskStatus:
@@ -39,11 +39,7 @@ class TaskResponse(BaseModel):
     export_size_bytes: Optional[int] = None
     error_message: Optional[str] = None
 
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
 class TaskUploadResponse(BaseModel):
@@ -1,89 +1,188 @@
 """File operation utilities."""
 
+import asyncio
 import hashlib
+import io
 import logging
+import mmap
+import os
 import shutil
 import zipfile
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, BinaryIO, Iterator, Optional, Union
 
-import aiofiles
 from fastapi import UploadFile
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Size of the chunks handed to the HTTP response when streaming zip archives
+ZIP_STREAM_CHUNK_SIZE = 1024 * 1024  # 1MB
 
-async def save_upload_file(upload_file: UploadFile, destination: Path) -> int:
+# Text-based asset formats that still benefit from DEFLATE (YAML-serialized
+# Unity assets, scripts, metadata); everything else is stored as-is
+TEXT_ASSET_SUFFIXES = frozenset({
+    ".anim", ".asset", ".controller", ".cs", ".json", ".mat", ".meta",
+    ".prefab", ".shader", ".txt", ".unity", ".xml", ".yaml",
+})
+
+
+async def save_upload_file(upload_file: UploadFile, destination: Path) -> tuple[int, str]:
     """
     Save uploaded file to destination using streaming to avoid memory issues.
 
+    The SHA256 is computed while the file is written, so the upload never
+    has to be read back from disk to hash it.
+
     Args:
         upload_file: FastAPI UploadFile object
         destination: Destination file path
 
     Returns:
-        int: File size in bytes
+        tuple: (file size in bytes, hex string of SHA256 hash)
     """
     destination.parent.mkdir(parents=True, exist_ok=True)
 
-    total_bytes = 0
-    async with aiofiles.open(destination, "wb") as f:
-        while chunk := await upload_file.read(8192):  # 8KB chunks
-            await f.write(chunk)
-            total_bytes += len(chunk)
+    # Large uploads are already spooled to a temp file by Starlette: copy them
+    # in kernel space instead of pumping every chunk through Python
+    if getattr(upload_file.file, "_rolled", False):
+        total_bytes, file_hash = await asyncio.to_thread(
+            _save_spooled_upload, upload_file.file, destination
+        )
+        logger.info(f"Saved upload file to {destination} ({total_bytes} bytes)")
+        return total_bytes, file_hash
 
-    logger.info(f"Saved upload file to {destination} ({total_bytes} bytes)")
-    return total_bytes
+    # Small uploads Starlette kept in memory (up to its 1MB spool size): the
+    # bytes are already here, so write them in a single thread hop
+    data = await upload_file.read()
+    await asyncio.to_thread(destination.write_bytes, data)
 
+    logger.info(f"Saved upload file to {destination} ({len(data)} bytes)")
+    return len(data), hashlib.sha256(data).hexdigest()
 
-async def calculate_file_hash(file_path: Path) -> str:
-    """
-    Calculate SHA256 hash of a file.
 
-    Args:
-        file_path: Path to file
+def _save_spooled_upload(src: BinaryIO, destination: Path) -> tuple[int, str]:
+    """
+    Copy a disk-backed upload in kernel space, hashing it through mmap.
 
-    Returns:
-        str: Hex string of SHA256 hash
+    Raises:
+        OSError: If fewer than all bytes reached destination (which is removed)
     """
+    src_fd = src.fileno()
+    size = os.fstat(src_fd).st_size
     sha256 = hashlib.sha256()
+    copied = 0
+
+    with open(destination, "wb", buffering=0) as dst:
+        if size:
+            with mmap.mmap(src_fd, 0, access=mmap.ACCESS_READ) as mm:
+                _madvise_sequential(mm)
+                sha256.update(mm)
+                copied = _kernel_copy(src_fd, dst.fileno(), size)
+                if copied < size:
+                    # Kernel copy unavailable (or interrupted): write the rest
+                    # from the mapping. Raw writes may be partial (Linux caps
+                    # one at ~2GB), so loop until everything is written
+                    with memoryview(mm) as view:
+                        while copied < size:
+                            with view[copied:] as rest:
+                                written = dst.write(rest)
+                            if not written:
+                                break
+                            copied += written
+
+    if copied != size:
+        destination.unlink(missing_ok=True)
+        raise OSError(f"Short copy of upload to {destination}: {copied} of {size} bytes")
+
+    return size, sha256.hexdigest()
+
+
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> int:
+    """
+    Copy up to size bytes between fds in kernel space; return bytes copied.
 
-    async with aiofiles.open(file_path, "rb") as f:
-        while chunk := await f.read(8192):
-            sha256.update(chunk)
+    Tries os.copy_file_range first, then continues with os.sendfile where
+    that is unavailable or refuses the pair (e.g. older kernels across
+    filesystems).
+    """
+    copied = 0
+
+    for name in ("copy_file_range", "sendfile"):
+        if copied >= size or not hasattr(os, name):
+            continue
+        try:
+            while copied < size:
+                if name == "copy_file_range":
+                    count = os.copy_file_range(src_fd, dst_fd, size - copied, copied)
+                else:
+                    count = os.sendfile(dst_fd, src_fd, copied, size - copied)
+                if count == 0:
+                    break
+                copied += count
+        except OSError as e:
+            logger.debug(f"{name} failed after {copied} bytes: {e}")
+
+    return copied
+
+
+def _fadvise(fd: int, advice: str) -> None:
+    """
+    Give the kernel a whole-file access hint, e.g. "POSIX_FADV_SEQUENTIAL".
+
+    Hints are best effort and a no-op where posix_fadvise is unavailable.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+    except OSError:
+        pass
 
-    return sha256.hexdigest()
+
+def _madvise_sequential(mm: mmap.mmap) -> None:
+    """Ask for aggressive read-ahead on a mapping read front to back."""
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
 
 
 def get_directory_size(directory: Path) -> int:
     """
     Calculate total size of directory recursively.
 
+    Counts exactly the files create_zip_archive and iter_zip_stream include
+    (symlinked files by their target's size), so the size predicts what a
+    download will send.
+
     Args:
         directory: Directory path
 
     Returns:
         int: Total size in bytes
     """
-    total_size = 0
-
-    for item in directory.rglob("*"):
-        if item.is_file():
-            total_size += item.stat().st_size
-
-    return total_size
+    return sum(entry.stat().st_size for entry in _scan_files(directory))
 
 
-def create_zip_archive(source_dir: Path, output_zip: Path, arcname: Optional[str] = None) -> int:
+def create_zip_archive(
+    source_dir: Path,
+    output_zip: Union[Path, BinaryIO],
+    arcname: Optional[str] = None,
+    compression: int = zipfile.ZIP_STORED,
+    compress_text: bool = False,
+) -> int:
     """
     Create a zip archive from a directory.
 
+    Entries are stored uncompressed by default: exported textures, audio and
+    meshes are already compressed, so DEFLATE costs CPU for almost no gain.
+
     Args:
         source_dir: Source directory to archive
-        output_zip: Output zip file path
+        output_zip: Output zip file path, or a seekable binary file object
         arcname: Archive name (defaults to source_dir name)
+        compression: Default compression method for entries
+        compress_text: DEFLATE text-based assets (see TEXT_ASSET_SUFFIXES)
 
     Returns:
         int: Zip file size in bytes
@@ -91,23 +190,197 @@ def create_zip_archive(source_dir: Path, output_zip: Path, arcname: Optional[str
     if not source_dir.exists():
         raise FileNotFoundError(f"Source directory not found: {source_dir}")
 
-    output_zip.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(output_zip, Path):
+        output_zip.parent.mkdir(parents=True, exist_ok=True)
 
     arcname = arcname or source_dir.name
 
-    with zipfile.ZipFile(output_zip, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for file_path in source_dir.rglob("*"):
-            if file_path.is_file():
-                # Calculate relative path for archive
-                rel_path = file_path.relative_to(source_dir)
-                arc_path = Path(arcname) / rel_path
-                zipf.write(file_path, arc_path)
-
-    zip_size = output_zip.stat().st_size
-    logger.info(f"Created zip archive: {output_zip} ({zip_size} bytes)")
+    with zipfile.ZipFile(output_zip, "w", compression) as zipf:
+        for file_path, arc_path in _iter_archive_entries(source_dir, arcname):
+            zinfo = zipfile.ZipInfo.from_file(file_path, arc_path)
+            zinfo.compress_type = _entry_compress_type(file_path, compression, compress_text)
+            # ZipFile.write copies in 8KB steps; handing the whole mapped file
+            # to the entry writer needs a single crc32 and write call instead
+            with open(file_path, "rb") as src, zipf.open(zinfo, "w") as dest:
+                if zinfo.file_size:
+                    with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        _madvise_sequential(mm)
+                        dest.write(mm)
+                    # Export files are read once per archive; free their pages
+                    # for the next upload rather than caching them twice
+                    _fadvise(src.fileno(), "POSIX_FADV_DONTNEED")
+
+    if isinstance(output_zip, Path):
+        zip_size = output_zip.stat().st_size
+        logger.info(f"Created zip archive: {output_zip} ({zip_size} bytes)")
+    else:
+        zip_size = output_zip.tell()
+        logger.info(f"Created zip archive of {source_dir} ({zip_size} bytes)")
     return zip_size
 
 
+async def iter_file_chunks(
+    fileobj: BinaryIO, chunk_size: int = ZIP_STREAM_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """
+    Stream a file object from the beginning and close it afterwards.
+
+    Reads from a tempfile.SpooledTemporaryFile that is still held in memory
+    are served directly; anything backed by disk is read in the executor.
+
+    Args:
+        fileobj: Seekable binary file object
+        chunk_size: Size of each yielded chunk in bytes
+
+    Yields:
+        bytes: Consecutive chunks of the file
+    """
+    loop = asyncio.get_running_loop()
+    in_memory = not getattr(fileobj, "_rolled", True)
+
+    try:
+        fileobj.seek(0)
+        while True:
+            if in_memory:
+                chunk = fileobj.read(chunk_size)
+            else:
+                chunk = await loop.run_in_executor(None, fileobj.read, chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        fileobj.close()
+
+
+async def iter_zip_stream(
+    source_dir: Path,
+    arcname: Optional[str] = None,
+    compress_text: bool = False,
+    chunk_size: int = ZIP_STREAM_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    Stream a zip archive of a directory without writing it to disk.
+
+    Entries are stored uncompressed (ZIP_STORED) since exported assets are
+    mostly already-compressed textures and audio. File reads and zip writes
+    run in the default executor so the event loop is never blocked.
+
+    Args:
+        source_dir: Source directory to archive (must exist)
+        arcname: Archive name (defaults to source_dir name)
+        compress_text: DEFLATE text-based assets (see TEXT_ASSET_SUFFIXES)
+        chunk_size: Approximate size of each yielded chunk in bytes
+
+    Yields:
+        bytes: Consecutive chunks of the zip archive
+    """
+    loop = asyncio.get_running_loop()
+    chunks = _iter_zip_chunks(source_dir, arcname or source_dir.name, compress_text, chunk_size)
+
+    try:
+        while (chunk := await loop.run_in_executor(None, next, chunks, None)) is not None:
+            yield chunk
+    finally:
+        # If the client disconnected while a chunk was being produced, the
+        # generator is still running in the executor and is closed on GC instead
+        if not chunks.gi_running:
+            chunks.close()
+
+
+class _ZipStreamSink(io.RawIOBase):
+    """Unseekable write-only buffer collecting the bytes emitted by ZipFile."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def drain(self) -> bytes:
+        """Return and clear everything written so far."""
+        # A lone chunk (the common case mid-file) is handed over without copying
+        data = self._chunks[0] if len(self._chunks) == 1 else b"".join(self._chunks)
+        self._chunks.clear()
+        self.size = 0
+        return data
+
+
+def _iter_zip_chunks(
+    source_dir: Path, arcname: str, compress_text: bool, chunk_size: int
+) -> Iterator[bytes]:
+    """Build a zip archive into a _ZipStreamSink, yielding it in chunks."""
+    sink = _ZipStreamSink()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_STORED) as zipf:
+        for file_path, arc_path in _iter_archive_entries(source_dir, arcname):
+            zinfo = zipfile.ZipInfo.from_file(file_path, arc_path)
+            zinfo.compress_type = _entry_compress_type(
+                file_path, zipfile.ZIP_STORED, compress_text
+            )
+            # Read into one reused buffer rather than allocating every chunk
+            with open(file_path, "rb", buffering=0) as src, zipf.open(zinfo, "w") as dest:
+                _fadvise(src.fileno(), "POSIX_FADV_SEQUENTIAL")
+                while n := src.readinto(buffer):
+                    dest.write(view[:n])
+                    if sink.size >= chunk_size:
+                        yield sink.drain()
+                _fadvise(src.fileno(), "POSIX_FADV_DONTNEED")
+
+    # Remaining entries and the central directory
+    yield sink.drain()
+
+
+def _entry_compress_type(file_path: Path, compression: int, compress_text: bool) -> int:
+    """Pick the compression method for a single archive entry."""
+    if compress_text and file_path.suffix.lower() in TEXT_ASSET_SUFFIXES:
+        return zipfile.ZIP_DEFLATED
+    return compression
+
+
+def _iter_archive_entries(source_dir: Path, arcname: str) -> Iterator[tuple[Path, Path]]:
+    """
+    Yield (file_path, arc_path) for every file below source_dir.
+
+    Files are visited in inode order, which on most filesystems follows
+    on-disk placement and turns the read pass into mostly sequential I/O.
+    """
+    files = sorted((entry.inode(), entry.path) for entry in _scan_files(source_dir))
+
+    for _, path in files:
+        # Calculate relative path for archive
+        file_path = Path(path)
+        rel_path = file_path.relative_to(source_dir)
+        yield file_path, Path(arcname) / rel_path
+
+
+def _scan_files(directory: Path) -> Iterator[os.DirEntry]:
+    """
+    Yield an os.DirEntry for every file below directory.
+
+    Files are matched through symlinks, but symlinked directories are not
+    descended into, so a link cycle cannot make the walk loop. os.scandir
+    entries carry the file type from readdir, so no Path objects are built.
+    """
+    stack = [str(directory)]
+
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    yield entry
+                elif entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+
+
 def delete_directory(directory: Path) -> None:
     """
     Delete a directory and all its contents.
@@ -115,9 +388,13 @@ def delete_directory(directory: Path) -> None:
     Args:
         directory: Directory to delete
     """
-    if directory.exists():
+    # rmtree already takes the fd-based openat/unlinkat path on Linux; a
+    # missing directory is the common case for tasks that never exported
+    try:
         shutil.rmtree(directory)
-        logger.info(f"Deleted directory: {directory}")
+    except FileNotFoundError:
+        return
+    logger.info(f"Deleted directory: {directory}")
 
 
 def delete_file(file_path: Path) -> None:
@@ -127,9 +404,75 @@ def delete_file(file_path: Path) -> None:
     Args:
         file_path: File to delete
     """
-    if file_path.exists():
+    try:
         file_path.unlink()
-        logger.info(f"Deleted file: {file_path}")
+    except FileNotFoundError:
+        return
+    logger.info(f"Deleted file: {file_path}")
+
+
+def link_duplicate_file(source: Path, destination: Path) -> bool:
+    """
+    Replace destination with a hard link to source, whose content is identical.
+
+    Args:
+        source: Existing file with the same content
+        destination: File to replace
+
+    Returns:
+        bool: True if linked, False if destination was left untouched
+    """
+    tmp_path = destination.with_name(f"{destination.name}.link")
+
+    try:
+        os.link(source, tmp_path)
+        os.replace(tmp_path, destination)
+    except OSError as e:
+        logger.warning(f"Could not link {destination} to {source}: {e}")
+        tmp_path.unlink(missing_ok=True)
+        return False
+
+    logger.info(f"Linked duplicate file {destination} to {source}")
+    return True
+
+
+def link_directory_tree(source: Path, destination: Path) -> None:
+    """
+    Recreate source's tree at destination, hard-linking every file.
+
+    The copy shares data blocks but not directory entries, so deleting
+    either tree leaves the other intact. Files that cannot be linked (e.g.
+    on another filesystem) are copied instead.
+
+    Args:
+        source: Existing directory tree
+        destination: Directory to create; must not exist yet
+
+    Raises:
+        OSError: If the tree cannot be created (a partial copy is removed)
+    """
+    stack = [(source, destination)]
+
+    try:
+        while stack:
+            src_dir, dst_dir = stack.pop()
+            dst_dir.mkdir(parents=True)
+            with os.scandir(src_dir) as entries:
+                for entry in entries:
+                    target = dst_dir / entry.name
+                    # Same selection as _scan_files
+                    if entry.is_file():
+                        try:
+                            os.link(entry.path, target)
+                        except OSError:
+                            shutil.copy2(entry.path, target)
+                    elif entry.is_dir(follow_symlinks=False):
+                        stack.append((Path(entry.path), target))
+    except OSError:
+        shutil.rmtree(destination, ignore_errors=True)
+        raise
+
+    logger.info(f"Linked export tree {source} to {destination}")
 
 
 def ensure_task_directories(task_id: str) -> tuple[Path, Path]:
@@ -10,4 +10,6 @@ LOG_LEVEL_LOWER=$(echo "${LOG_LEVEL:-info}" | tr '[:upper:]' '[:lower:]')
 exec uvicorn app.main:app \
     --host ${API_HOST:-0.0.0.0} \
     --port ${API_PORT:-8000} \
+    --loop uvloop \
+    --http httptools \
     --log-level ${LOG_LEVEL_LOWER}
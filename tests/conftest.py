@@ -0,0 +1,29 @@
+"""Shared test configuration: point settings at a throwaway data directory."""
+
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+_data_dir = tempfile.mkdtemp(prefix="assetripper-tests-")
+os.makedirs(f"{_data_dir}/db")
+
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_data_dir}/db/tasks.db"
+os.environ["UPLOAD_DIR"] = f"{_data_dir}/uploads"
+os.environ["EXPORT_DIR"] = f"{_data_dir}/exports"
+
+
+@pytest.fixture
+def fresh_db():
+    """Recreate all tables so each test starts from an empty database."""
+    # Imported here so settings pick up the environment set above
+    from app.database import Base, close_db, engine, init_db
+
+    async def reset():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await init_db()
+        await close_db()
+
+    asyncio.run(reset())
@@ -0,0 +1,54 @@
+"""Tests for the AssetRipper manager health probe."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.assetripper import AssetRipperManager
+
+
+def _manager_with(handler) -> AssetRipperManager:
+    manager = AssetRipperManager()
+    manager.client = httpx.AsyncClient(
+        base_url="http://assetripper", transport=httpx.MockTransport(handler)
+    )
+    return manager
+
+
+def test_probe_records_failures_and_probes_again():
+    requests = []
+    responses = [200, "down", 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        outcome = responses[len(requests) - 1]
+        if outcome == "down":
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(outcome)
+
+    async def scenario():
+        manager = _manager_with(handler)
+        states = [await manager._probe()]
+
+        with pytest.raises(httpx.RequestError):
+            await manager._probe()
+        states.append(manager.is_healthy)
+
+        # Straight after a failure the next probe goes to the network again
+        states.append(await manager._probe())
+        await manager.client.aclose()
+        return states
+
+    assert asyncio.run(scenario()) == [True, False, True]
+    assert len(requests) == 3
+
+
+def test_probe_non_200_is_unhealthy():
+    async def scenario():
+        manager = _manager_with(lambda request: httpx.Response(503))
+        healthy = await manager._probe()
+        await manager.client.aclose()
+        return healthy, manager.is_healthy
+
+    assert asyncio.run(scenario()) == (False, False)
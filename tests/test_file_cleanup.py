@@ -0,0 +1,202 @@
+"""Tests for the file cleanup scheduler."""
+
+import asyncio
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.config import settings
+from app.core import file_cleanup
+from app.core.file_cleanup import FileCleanupScheduler
+from app.database import AsyncSessionLocal, close_db
+from app.models import CleanupLog, Task
+from app.schemas import TaskStatus
+from app.utils.file_utils import ensure_task_directories, get_task_assets_dir
+
+
+pytestmark = pytest.mark.usefixtures("fresh_db")
+
+
+def _expired() -> datetime:
+    return datetime.utcnow() - timedelta(days=settings.file_retention_days + 1)
+
+
+async def _add_task(created_at: datetime) -> str:
+    task_id = str(uuid.uuid4())
+    upload_dir, _ = ensure_task_directories(task_id)
+    (upload_dir / "game.apk").write_bytes(b"apk")
+    get_task_assets_dir(task_id).mkdir()
+    (get_task_assets_dir(task_id) / "asset.bin").write_bytes(b"asset")
+
+    async with AsyncSessionLocal() as db:
+        db.add(
+            Task(
+                id=task_id,
+                status=TaskStatus.COMPLETED,
+                created_at=created_at,
+                original_filename="game.apk",
+                upload_path=str(upload_dir / "game.apk"),
+                file_size_bytes=3,
+                export_path=str(get_task_assets_dir(task_id)),
+            )
+        )
+        await db.commit()
+
+    return task_id
+
+
+async def _cleanup_log_task_ids() -> list[str]:
+    async with AsyncSessionLocal() as db:
+        return list(await db.scalars(select(CleanupLog.task_id)))
+
+
+def test_cleanup_removes_expired_task_files_once():
+    async def scenario():
+        old_ids = [await _add_task(_expired()) for _ in range(3)]
+        recent_id = await _add_task(datetime.utcnow())
+
+        scheduler = FileCleanupScheduler()
+        scheduler.start()
+        try:
+            await scheduler._cleanup_old_files()
+            first_run = await _cleanup_log_task_ids()
+
+            # Rows are kept after cleanup; a second pass must not log them again
+            await scheduler._cleanup_old_files()
+            second_run = await _cleanup_log_task_ids()
+        finally:
+            scheduler.stop()
+
+        async with AsyncSessionLocal() as db:
+            task_count = await db.scalar(select(func.count()).select_from(Task))
+
+        await close_db()
+        return old_ids, recent_id, first_run, second_run, task_count
+
+    old_ids, recent_id, first_run, second_run, task_count = asyncio.run(scenario())
+
+    assert sorted(first_run) == sorted(old_ids)
+    assert sorted(second_run) == sorted(old_ids)
+    assert task_count == 4
+    for task_id in old_ids:
+        assert not (settings.upload_dir / task_id).exists()
+        assert not (settings.export_dir / task_id).exists()
+    assert (settings.upload_dir / recent_id).exists()
+    assert get_task_assets_dir(recent_id).exists()
+
+
+def test_cleanup_failure_is_not_logged_and_retried(monkeypatch):
+    real_cleanup = file_cleanup.cleanup_task_files
+    failing_ids = set()
+
+    def flaky_cleanup(task_id: str) -> None:
+        if task_id in failing_ids:
+            raise OSError("device busy")
+        real_cleanup(task_id)
+
+    monkeypatch.setattr(file_cleanup, "cleanup_task_files", flaky_cleanup)
+    # Several batches, so the failed task is paged past within the run
+    monkeypatch.setattr(file_cleanup, "CLEANUP_BATCH_SIZE", 2)
+
+    async def scenario():
+        task_ids = [await _add_task(_expired()) for _ in range(5)]
+        failing_ids.add(task_ids[0])
+
+        scheduler = FileCleanupScheduler()
+        scheduler.start()
+        try:
+            await scheduler._cleanup_old_files()
+            first_run = await _cleanup_log_task_ids()
+            kept_after_failure = (settings.upload_dir / task_ids[0]).exists()
+
+            failing_ids.clear()
+            await scheduler._cleanup_old_files()
+            second_run = await _cleanup_log_task_ids()
+        finally:
+            scheduler.stop()
+
+        await close_db()
+        return task_ids, first_run, kept_after_failure, second_run
+
+    task_ids, first_run, kept_after_failure, second_run = asyncio.run(scenario())
+
+    assert sorted(first_run) == sorted(task_ids[1:])
+    assert kept_after_failure
+    assert sorted(second_run) == sorted(task_ids)
+    assert not (settings.upload_dir / task_ids[0]).exists()
+
+
+def test_cleanup_does_not_hold_write_lock_while_deleting(monkeypatch):
+    real_cleanup = file_cleanup.cleanup_task_files
+    write_errors = []
+    db_file = settings.database_url.replace("sqlite+aiosqlite:///", "")
+
+    def cleanup_during_concurrent_write(task_id: str) -> None:
+        # Stands in for an upload or task-queue write arriving mid-cleanup
+        conn = sqlite3.connect(db_file, timeout=0.2)
+        try:
+            conn.execute("UPDATE tasks SET retry_count = retry_count WHERE id = ?", (task_id,))
+            conn.commit()
+        except sqlite3.OperationalError as e:
+            write_errors.append(e)
+        finally:
+            conn.close()
+        real_cleanup(task_id)
+
+    monkeypatch.setattr(file_cleanup, "cleanup_task_files", cleanup_during_concurrent_write)
+    monkeypatch.setattr(file_cleanup, "CLEANUP_BATCH_SIZE", 2)
+
+    async def scenario():
+        task_ids = [await _add_task(_expired()) for _ in range(5)]
+
+        scheduler = FileCleanupScheduler()
+        scheduler.start()
+        try:
+            await scheduler._cleanup_old_files()
+        finally:
+            scheduler.stop()
+
+        logged = await _cleanup_log_task_ids()
+        await close_db()
+        return task_ids, logged
+
+    task_ids, logged = asyncio.run(scenario())
+
+    assert write_errors == []
+    assert sorted(logged) == sorted(task_ids)
+
+
+def test_cleanup_runs_on_dedicated_executor(monkeypatch):
+    thread_names = []
+
+    def record_cleanup(task_id: str) -> None:
+        thread_names.append(threading.current_thread().name)
+
+    monkeypatch.setattr(file_cleanup, "cleanup_task_files", record_cleanup)
+
+    async def scenario():
+        for _ in range(3):
+            await _add_task(_expired())
+
+        scheduler = FileCleanupScheduler()
+        assert scheduler._executor is None
+
+        scheduler.start()
+        assert scheduler._executor is not None
+        try:
+            await scheduler._cleanup_old_files()
+        finally:
+            scheduler.stop()
+
+        await close_db()
+        return scheduler._executor
+
+    executor_after_stop = asyncio.run(scenario())
+
+    assert len(thread_names) == 3
+    assert all(name.startswith("file-cleanup") for name in thread_names)
+    assert executor_after_stop is None
@@ -0,0 +1,99 @@
+"""Tests for file operation utilities."""
+
+import hashlib
+import io
+import os
+import tempfile
+import zipfile
+
+import pytest
+
+from app.utils import file_utils
+
+
+class _CappedFileIO(io.FileIO):
+    """Raw file whose writes are partial, like a write capped by the kernel."""
+
+    cap = 4096
+
+    def write(self, b):
+        with memoryview(b) as view, view[: self.cap] as head:
+            return super().write(head)
+
+
+def _spooled_source(data: bytes):
+    src = tempfile.TemporaryFile()
+    src.write(data)
+    src.flush()
+    return src
+
+
+@pytest.fixture
+def payload() -> bytes:
+    return os.urandom(1024 * 1024 + 123)
+
+
+def test_save_spooled_upload_without_kernel_copy(tmp_path, monkeypatch, payload):
+    monkeypatch.setattr(file_utils, "_kernel_copy", lambda src_fd, dst_fd, size: 0)
+    destination = tmp_path / "upload.bin"
+
+    with _spooled_source(payload) as src:
+        size, file_hash = file_utils._save_spooled_upload(src, destination)
+
+    assert size == len(payload)
+    assert file_hash == hashlib.sha256(payload).hexdigest()
+    assert destination.read_bytes() == payload
+
+
+def test_save_spooled_upload_finishes_partial_writes(tmp_path, monkeypatch, payload):
+    def partial_kernel_copy(src_fd, dst_fd, size):
+        return os.sendfile(dst_fd, src_fd, 0, 1000)
+
+    monkeypatch.setattr(file_utils, "_kernel_copy", partial_kernel_copy)
+    monkeypatch.setattr(
+        file_utils, "open", lambda path, mode, buffering=-1: _CappedFileIO(path, mode), raising=False
+    )
+    destination = tmp_path / "upload.bin"
+
+    with _spooled_source(payload) as src:
+        size, file_hash = file_utils._save_spooled_upload(src, destination)
+
+    assert size == len(payload)
+    assert file_hash == hashlib.sha256(payload).hexdigest()
+    assert destination.read_bytes() == payload
+
+
+def test_save_spooled_upload_raises_on_short_copy(tmp_path, monkeypatch, payload):
+    class _StalledFileIO(io.FileIO):
+        def write(self, b):
+            return 0
+
+    monkeypatch.setattr(file_utils, "_kernel_copy", lambda src_fd, dst_fd, size: 0)
+    monkeypatch.setattr(
+        file_utils, "open", lambda path, mode, buffering=-1: _StalledFileIO(path, mode), raising=False
+    )
+    destination = tmp_path / "upload.bin"
+
+    with _spooled_source(payload) as src, pytest.raises(OSError, match="Short copy"):
+        file_utils._save_spooled_upload(src, destination)
+
+    assert not destination.exists()
+
+
+def test_directory_size_matches_archived_bytes(tmp_path):
+    assets = tmp_path / "Assets"
+    (assets / "sub").mkdir(parents=True)
+    (assets / "sub" / "mesh.bin").write_bytes(b"m" * 3000)
+    (assets / "empty.asset").write_bytes(b"")
+    target = tmp_path / "shared.bin"
+    target.write_bytes(b"s" * 500)
+    (assets / "linked.bin").symlink_to(target)
+    # Symlinked directories are not descended into by either walk
+    (assets / "linked_dir").symlink_to(assets / "sub", target_is_directory=True)
+
+    archive = io.BytesIO()
+    file_utils.create_zip_archive(assets, archive)
+    archived = sum(info.file_size for info in zipfile.ZipFile(archive).infolist())
+
+    assert archived == 3500
+    assert file_utils.get_directory_size(assets) == archived
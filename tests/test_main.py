@@ -0,0 +1,50 @@
+"""Tests for the application lifespan."""
+
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.core.assetripper import assetripper_manager
+from app.core.file_cleanup import file_cleanup_scheduler
+from app.core.task_queue import task_queue_manager
+from app.main import app, lifespan
+
+
+@pytest.fixture(autouse=True)
+def stub_managers(monkeypatch):
+    """Keep the lifespan from starting AssetRipper and the task worker."""
+
+    async def noop():
+        return None
+
+    for manager in (assetripper_manager, task_queue_manager):
+        monkeypatch.setattr(manager, "start", noop)
+        monkeypatch.setattr(manager, "stop", noop)
+
+
+def _run_lifespan() -> tuple[bool, bool]:
+    async def scenario():
+        async with lifespan(app):
+            running = file_cleanup_scheduler._running
+        return running, file_cleanup_scheduler._running
+
+    return asyncio.run(scenario())
+
+
+def test_lifespan_leaves_cleanup_scheduler_off_by_default():
+    assert settings.file_cleanup_enabled is False
+
+    running, running_after = _run_lifespan()
+
+    assert not running
+    assert not running_after
+
+
+def test_lifespan_starts_and_stops_cleanup_scheduler_when_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "file_cleanup_enabled", True)
+
+    running, running_after = _run_lifespan()
+
+    assert running
+    assert not running_after
@@ -0,0 +1,128 @@
+"""Tests for task processing in the task queue manager."""
+
+import asyncio
+import uuid
+from pathlib import Path
+
+import pytest
+
+from app.core import task_queue
+from app.core.assetripper import AssetRipperError, assetripper_manager
+from app.core.task_queue import TaskQueueManager
+from app.database import AsyncSessionLocal, close_db
+from app.models import Task
+from app.schemas import TaskStatus
+from app.utils.file_utils import ensure_task_directories, get_task_assets_dir
+
+pytestmark = pytest.mark.usefixtures("fresh_db")
+
+
+@pytest.fixture
+def session_count(monkeypatch):
+    """Count sessions opened by the task queue."""
+    opened = []
+
+    def counting_session():
+        opened.append(1)
+        return AsyncSessionLocal()
+
+    monkeypatch.setattr(task_queue, "AsyncSessionLocal", counting_session)
+    return opened
+
+
+@pytest.fixture
+def fake_assetripper(monkeypatch):
+    """Stand-in AssetRipper that exports one asset, or fails on load if asked."""
+    calls = {"fail_load": False, "reset": 0}
+
+    async def load_file(path: str) -> None:
+        if calls["fail_load"]:
+            raise AssetRipperError("LoadFile failed")
+
+    async def export_primary_content(path: str) -> None:
+        assets_dir = Path(path) / "Assets"
+        assets_dir.mkdir(parents=True)
+        (assets_dir / "asset.bin").write_bytes(b"x" * 1234)
+
+    async def reset() -> None:
+        calls["reset"] += 1
+
+    monkeypatch.setattr(assetripper_manager, "load_file", load_file)
+    monkeypatch.setattr(assetripper_manager, "export_primary_content", export_primary_content)
+    monkeypatch.setattr(assetripper_manager, "reset", reset)
+    return calls
+
+
+async def _add_pending_task() -> str:
+    task_id = str(uuid.uuid4())
+    upload_dir, _ = ensure_task_directories(task_id)
+    (upload_dir / "game.apk").write_bytes(b"apk")
+
+    async with AsyncSessionLocal() as db:
+        db.add(
+            Task(
+                id=task_id,
+                status=TaskStatus.PENDING,
+                original_filename="game.apk",
+                upload_path=str(upload_dir / "game.apk"),
+                file_size_bytes=3,
+            )
+        )
+        await db.commit()
+
+    return task_id
+
+
+def _process(fake_assetripper) -> Task:
+    async def scenario():
+        task_id = await _add_pending_task()
+        await TaskQueueManager()._process_task(task_id)
+
+        async with AsyncSessionLocal() as db:
+            task = await db.get(Task, task_id)
+
+        await close_db()
+        return task
+
+    return asyncio.run(scenario())
+
+
+def test_process_task_completes_in_one_session(fake_assetripper, session_count):
+    task = _process(fake_assetripper)
+
+    assert task.status == TaskStatus.COMPLETED
+    assert task.started_at is not None and task.completed_at is not None
+    assert task.export_path == str(get_task_assets_dir(task.id))
+    assert task.export_size_bytes == 1234
+    assert len(session_count) == 1
+
+
+def test_process_task_failure_uses_same_session(fake_assetripper, session_count):
+    fake_assetripper["fail_load"] = True
+
+    task = _process(fake_assetripper)
+
+    assert task.status == TaskStatus.FAILED
+    assert task.error_message == "AssetRipper error: LoadFile failed"
+    assert task.completed_at is not None
+    assert fake_assetripper["reset"] == 1
+    assert len(session_count) == 1
+
+
+def test_process_task_skips_task_that_is_not_pending(fake_assetripper):
+    async def scenario():
+        task_id = await _add_pending_task()
+        manager = TaskQueueManager()
+        await manager._process_task(task_id)
+        # A second claim of the same (now COMPLETED) task is a no-op
+        await manager._process_task(task_id)
+
+        async with AsyncSessionLocal() as db:
+            task = await db.get(Task, task_id)
+
+        await close_db()
+        return task
+
+    task = asyncio.run(scenario())
+
+    assert task.status == TaskStatus.COMPLETED
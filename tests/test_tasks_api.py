@@ -0,0 +1,162 @@
+"""Tests for the task endpoints."""
+
+import asyncio
+import io
+import uuid
+import zipfile
+
+import pytest
+from fastapi import BackgroundTasks
+
+from app.api.v1.endpoints import tasks
+from app.database import AsyncSessionLocal, close_db
+from app.models import Task
+from app.schemas import TaskStatus
+from app.utils.file_utils import ensure_task_directories, get_task_assets_dir
+
+pytestmark = pytest.mark.usefixtures("fresh_db")
+
+
+async def _add_task() -> str:
+    task_id = str(uuid.uuid4())
+    async with AsyncSessionLocal() as db:
+        db.add(
+            Task(
+                id=task_id,
+                status=TaskStatus.COMPLETED,
+                original_filename="game.apk",
+                upload_path=f"/nonexistent/{task_id}/game.apk",
+                file_size_bytes=3,
+            )
+        )
+        await db.commit()
+    return task_id
+
+
+async def _add_exported_task() -> str:
+    task_id = await _add_task()
+    ensure_task_directories(task_id)
+    assets_dir = get_task_assets_dir(task_id)
+    assets_dir.mkdir()
+    (assets_dir / "mesh.bin").write_bytes(b"m" * 3000)
+
+    async with AsyncSessionLocal() as db:
+        task = await db.get(Task, task_id)
+        task.export_path = str(assets_dir)
+        task.export_size_bytes = 3000
+        await db.commit()
+    return task_id
+
+
+async def _download(task_id: str) -> tuple[dict, bool, bytes]:
+    """Call download_assets and read its body; note if a spool slot was held."""
+    async with AsyncSessionLocal() as db:
+        response = await tasks.download_assets(task_id, db)
+
+    slot_held = tasks._spool_slots.locked()
+    body = b"".join([chunk async for chunk in response.body_iterator])
+
+    await close_db()
+    return response.headers, slot_held, body
+
+
+async def _delete_task(task_id: str, on_handler_return) -> tuple[dict, Task]:
+    """Call delete_task, then run its background tasks as Starlette would."""
+    background = BackgroundTasks()
+    async with AsyncSessionLocal() as db:
+        response = await tasks.delete_task(task_id, background, db)
+        await db.commit()
+
+    on_handler_return()
+    await background()
+
+    async with AsyncSessionLocal() as db:
+        remaining = await db.get(Task, task_id)
+
+    await close_db()
+    return response, remaining
+
+
+def test_delete_task_removes_files_after_responding(monkeypatch):
+    cleaned = []
+    cleaned_before_response = []
+    monkeypatch.setattr(tasks, "cleanup_task_files", cleaned.append)
+
+    async def scenario():
+        task_id = await _add_task()
+        response, remaining = await _delete_task(
+            task_id, lambda: cleaned_before_response.extend(cleaned)
+        )
+        return task_id, response, remaining
+
+    task_id, response, remaining = asyncio.run(scenario())
+
+    assert response["task_id"] == task_id
+    assert remaining is None
+    assert cleaned_before_response == []
+    assert cleaned == [task_id]
+
+
+def test_delete_task_cleanup_failure_is_logged(monkeypatch, caplog):
+    def failing_cleanup(task_id: str) -> None:
+        raise OSError("device busy")
+
+    monkeypatch.setattr(tasks, "cleanup_task_files", failing_cleanup)
+
+    async def scenario():
+        task_id = await _add_task()
+        response, remaining = await _delete_task(task_id, lambda: None)
+        return task_id, response, remaining
+
+    task_id, response, remaining = asyncio.run(scenario())
+
+    assert response["task_id"] == task_id
+    assert remaining is None
+    assert f"Failed to clean up files for task {task_id}" in caplog.text
+
+
+def test_download_spools_small_export_and_frees_the_slot(monkeypatch):
+    monkeypatch.setattr(tasks, "_spool_slots", asyncio.Semaphore(1))
+
+    async def scenario():
+        return await _download(await _add_exported_task())
+
+    headers, slot_held, body = asyncio.run(scenario())
+
+    assert headers["content-length"] == str(len(body))
+    assert slot_held
+    assert not tasks._spool_slots.locked()
+    assert [i.file_size for i in zipfile.ZipFile(io.BytesIO(body)).infolist()] == [3000]
+
+
+def test_download_streams_small_export_when_spool_slots_are_taken(monkeypatch):
+    monkeypatch.setattr(tasks, "_spool_slots", asyncio.Semaphore(0))
+
+    async def scenario():
+        return await _download(await _add_exported_task())
+
+    headers, _, body = asyncio.run(scenario())
+
+    assert "content-length" not in headers
+    assert [i.file_size for i in zipfile.ZipFile(io.BytesIO(body)).infolist()] == [3000]
+
+
+def test_download_frees_the_spool_slot_when_zipping_fails(monkeypatch):
+    def failing_zip(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(tasks, "_spool_slots", asyncio.Semaphore(1))
+    monkeypatch.setattr(tasks, "create_zip_archive", failing_zip)
+
+    async def scenario():
+        task_id = await _add_exported_task()
+        async with AsyncSessionLocal() as db:
+            with pytest.raises(tasks.HTTPException) as exc_info:
+                await tasks.download_assets(task_id, db)
+        await close_db()
+        return exc_info.value
+
+    error = asyncio.run(scenario())
+
+    assert error.status_code == 500
+    assert not tasks._spool_slots.locked()
@@ -0,0 +1,90 @@
+"""Tests for the upload endpoint."""
+
+import asyncio
+import io
+import zipfile
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select, update
+
+from app.config import settings
+from app.core.task_queue import task_queue_manager
+from app.database import AsyncSessionLocal, close_db
+from app.main import app
+from app.models import Task
+from app.schemas import TaskStatus
+from app.utils.file_utils import get_task_assets_dir
+
+pytestmark = pytest.mark.usefixtures("fresh_db")
+
+
+async def _complete_with_export(task_id: str) -> None:
+    assets_dir = get_task_assets_dir(task_id)
+    (assets_dir / "sub").mkdir(parents=True)
+    (assets_dir / "sub" / "mesh.bin").write_bytes(b"m" * 3000)
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(Task)
+            .where(Task.id == task_id)
+            .values(
+                status=TaskStatus.COMPLETED,
+                export_path=str(assets_dir),
+                export_size_bytes=3000,
+            )
+        )
+        await db.commit()
+
+    await close_db()
+
+
+def test_duplicate_upload_survives_deletion_of_original():
+    client = TestClient(app)
+    payload = b"identical apk bytes" * 100
+
+    original = client.post("/api/v1/upload", files={"file": ("a.apk", payload)}).json()
+    asyncio.run(_complete_with_export(original["task_id"]))
+
+    duplicate = client.post("/api/v1/upload", files={"file": ("b.apk", payload)}).json()
+
+    assert duplicate["status"] == TaskStatus.COMPLETED
+    assert original["task_id"] not in duplicate["message"]
+
+    assert client.delete(f"/api/v1/tasks/{original['task_id']}").status_code == 200
+
+    response = client.get(f"/api/v1/download/{duplicate['task_id']}")
+    assert response.status_code == 200
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    assert archive.testzip() is None
+    assert [info.file_size for info in archive.infolist()] == [3000]
+
+    task = client.get(f"/api/v1/tasks/{duplicate['task_id']}").json()
+    assert task["started_at"] == task["completed_at"] == task["created_at"]
+
+
+def test_upload_is_refused_with_503_when_task_queue_is_full(monkeypatch):
+    # The gate admits the upload, but the queue has filled up regardless
+    full_queue = asyncio.Queue(maxsize=1)
+    full_queue.put_nowait("queued-task")
+    monkeypatch.setattr(task_queue_manager, "queue", full_queue)
+    client = TestClient(app)
+    uploads_before = set(settings.upload_dir.iterdir())
+
+    response = client.post("/api/v1/upload", files={"file": ("a.apk", b"apk bytes")})
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "30"
+    assert response.json() == {
+        "error": "Service temporarily unavailable, too many pending tasks",
+        "status_code": 503,
+    }
+
+    async def task_count() -> int:
+        async with AsyncSessionLocal() as db:
+            count = len((await db.scalars(select(Task))).all())
+        await close_db()
+        return count
+
+    assert asyncio.run(task_count()) == 0
+    assert set(settings.upload_dir.iterdir()) == uploads_before